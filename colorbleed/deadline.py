@@ -0,0 +1,167 @@
+"""Helper functions for submitting jobs to Deadline"""
+
+import json
+import getpass
+from multiprocessing.pool import ThreadPool
+
+from avalon.vendor import requests
+from avalon.vendor.six import string_types
+from avalon.vendor.requests.adapters import HTTPAdapter
+from avalon.vendor.requests.packages.urllib3.util.retry import Retry
+
+# Connect and read timeout in seconds for requests to the Web Service
+TIMEOUT = (5, 60)
+
+# Maximum amount of requests sent concurrently, this matches the maximum
+# amount of connections kept in the session's connection pool
+MAX_CONCURRENT_REQUESTS = 8
+
+# The session is shared by all submissions so connections are kept alive
+_session = None
+
+# The local user name, resolved on first use
+_user = None
+
+
+def get_session():
+    """Return the session used for requests to the Deadline Web Service
+
+    The session is created on first use and reused afterwards so multiple
+    submissions, e.g. one per render layer, reuse the same connection.
+    Failed connections are retried.
+
+    Returns:
+        requests.Session: The shared session
+
+    """
+    global _session
+
+    if _session is None:
+        retry = Retry(total=3, backoff_factor=0.5)
+        adapter = HTTPAdapter(pool_connections=4,
+                              pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                              max_retries=retry)
+
+        _session = requests.Session()
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+
+    return _session
+
+
+def get_user(context):
+    """Return the user name to submit the Deadline jobs with
+
+    This is the Deadline user collected into the context. When no Deadline
+    user was collected the name of the local user is used instead, which is
+    looked up only once per session.
+
+    Args:
+        context (pyblish.api.Context): The publish context.
+
+    Returns:
+        str: The user name
+
+    """
+    global _user
+
+    user = context.data.get("deadlineUser")
+    if user is not None:
+        return user
+
+    if _user is None:
+        _user = getpass.getuser()
+
+    return _user
+
+
+def serialize(payload):
+    """Return the payload serialized to compact JSON
+
+    Already serialized payloads are returned as is. This allows a payload
+    to be serialized only once when it is also logged prior to submission.
+    No whitespace is added between items to keep the request body small.
+
+    Args:
+        payload (dict or str): The payload to serialize.
+
+    Returns:
+        str: The JSON serialized payload
+
+    """
+    if isinstance(payload, string_types):
+        return payload
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def post(url, payload):
+    """Post the payload as JSON to the Deadline Web Service
+
+    Args:
+        url (str): The url to post to, e.g. http://localhost:8082/api/jobs
+        payload (dict or str): The data to submit, optionally already
+            serialized to JSON.
+
+    Returns:
+        requests.Response: The response of the Web Service
+
+    """
+    return get_session().post(url,
+                              data=serialize(payload),
+                              headers={"Content-Type": "application/json"},
+                              timeout=TIMEOUT)
+
+
+def submit_jobs(url, payloads):
+    """Submit the job payloads to the Deadline Web Service
+
+    Each job is submitted with a separate request. When there are multiple
+    jobs these requests are sent concurrently over the shared session.
+
+    Args:
+        url (str): The jobs url, e.g. http://localhost:8082/api/jobs
+        payloads (list): The job payloads, each with "JobInfo", "PluginInfo"
+            and "AuxFiles". These may be already serialized to JSON.
+
+    Returns:
+        list: The submitted jobs, in the order of the payloads.
+
+    """
+
+    payloads = [serialize(payload) for payload in payloads]
+
+    if len(payloads) > 1:
+        # Submit the jobs concurrently to overlap the network round trips
+        pool = ThreadPool(min(MAX_CONCURRENT_REQUESTS, len(payloads)))
+        try:
+            responses = pool.map(lambda payload: post(url, payload), payloads)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        responses = [post(url, payload) for payload in payloads]
+
+    jobs = []
+    for response in responses:
+        if not response.ok:
+            raise RuntimeError(response.text)
+        jobs.append(response.json())
+
+    return jobs
+
+
+def environment_job_info(environment):
+    """Return the environment formatted as Deadline JobInfo keys
+
+    Deadline requires each environment variable to be passed as a separate
+    `EnvironmentKeyValue%d` key in the JobInfo, formatted as `key=value`.
+
+    Args:
+        environment (dict): The environment variables to pass to the job.
+
+    Returns:
+        dict: The JobInfo keys and values
+
+    """
+    return {"EnvironmentKeyValue%d" % index: "%s=%s" % item
+            for index, item in enumerate(environment.items())}
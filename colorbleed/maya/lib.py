@@ -93,6 +93,15 @@ _alembic_options = {
 INT_FPS = {15, 24, 25, 30, 48, 50, 60, 44100, 48000}
 FLOAT_FPS = {23.976, 29.97, 47.952, 59.94}
 
+# Plug-ins confirmed to be loaded in this session by `load_plugin`
+_loaded_plugins = set()
+
+# Version of the running Maya session, see `get_maya_version`
+_maya_version = None
+
+# Whether render setup is used in this session, see `has_render_setup`
+_render_setup = None
+
 
 def _get_mel_global(name):
     """Return the value of a mel global variable"""
@@ -414,7 +423,7 @@ def empty_sets(sets, force=False):
             cmds.connectAttr(src, dest)
 
         # Restore original members
-        for origin_set, members in original.iteritems():
+        for origin_set, members in original.items():
             cmds.sets(members, forceElement=origin_set)
 
 
@@ -646,7 +655,7 @@ def displaySmoothness(nodes,
         yield
     finally:
         # Revert state
-        for node, state in originals.iteritems():
+        for node, state in originals.items():
             if state:
                 cmds.displaySmoothness(node, **state)
 
@@ -689,7 +698,7 @@ def no_display_layers(nodes):
         yield
     finally:
         # Restore original members
-        for layer, members in original.iteritems():
+        for layer, members in original.items():
             cmds.editDisplayLayerMembers(layer, members, noRecurse=True)
 
 
@@ -833,6 +842,60 @@ def is_visible(node,
     return True
 
 
+def get_maya_version():
+    """Return the version of the running Maya session, e.g. "2018"
+
+    The version does not change during a session so it is queried only once.
+
+    Returns:
+        str: The version as returned by `cmds.about(version=True)`
+
+    """
+    global _maya_version
+
+    if _maya_version is None:
+        _maya_version = cmds.about(version=True)
+
+    return _maya_version
+
+
+def has_render_setup():
+    """Return whether the Maya session uses render setup
+
+    Maya only switches between render setup and legacy render layers on
+    startup, so this is queried only once per session.
+
+    Returns:
+        bool: The result of `cmds.mayaHasRenderSetup()`
+
+    """
+    global _render_setup
+
+    if _render_setup is None:
+        _render_setup = bool(cmds.mayaHasRenderSetup())
+
+    return _render_setup
+
+
+def load_plugin(name):
+    """Ensure the Maya plug-in is loaded.
+
+    The result is cached for the session so repeated calls, e.g. once per
+    published instance, avoid querying the plug-in manager each time.
+
+    Args:
+        name (str): Name of the plug-in, e.g. "AbcExport"
+
+    """
+    if name in _loaded_plugins:
+        return
+
+    if not cmds.pluginInfo(name, query=True, loaded=True):
+        cmds.loadPlugin(name, quiet=True)
+
+    _loaded_plugins.add(name)
+
+
 def extract_alembic(file,
                     startFrame=None,
                     endFrame=None,
@@ -893,7 +956,7 @@ def extract_alembic(file,
     """
 
     # Ensure alembic exporter is loaded
-    cmds.loadPlugin('AbcExport', quiet=True)
+    load_plugin("AbcExport")
 
     # Alembic Exporter requires forward slashes
     file = file.replace('\\', '/')
@@ -959,7 +1022,7 @@ def extract_alembic(file,
             options[key] = value
 
     # The `writeCreases` argument was changed to `autoSubd` in Maya 2018+
-    maya_version = int(cmds.about(version=True))
+    maya_version = int(get_maya_version())
     if maya_version >= 2018:
         options['autoSubd'] = options.pop('writeCreases', False)
 
@@ -1099,6 +1162,31 @@ def get_id_required_nodes(referenced_nodes=False, nodes=None):
     return nodes
 
 
+def get_instance_id_required_nodes(instance):
+    """Return the id required nodes of the publish instance
+
+    This is `get_id_required_nodes` for the members of the instance,
+    including referenced nodes. The result is cached on the publish context
+    per unique set of members so multiple validators can share it.
+
+    Args:
+        instance (pyblish.api.Instance): The publish instance.
+
+    Returns:
+        set: The id required nodes.
+
+    """
+
+    cache = instance.context.data.setdefault("idRequiredNodes", {})
+
+    members = tuple(sorted(instance))
+    if members not in cache:
+        cache[members] = get_id_required_nodes(referenced_nodes=True,
+                                               nodes=list(members))
+
+    return cache[members]
+
+
 def get_id(node):
     """
     Get the `cbId` attribute of the given node
@@ -1129,6 +1217,90 @@ def get_id(node):
         return
 
 
+def get_ids(nodes):
+    """Get the `cbId` attribute of multiple nodes
+
+    This is the same as calling `get_id` per node but it reuses the same
+    selection list and function set for all of them. Each node is resolved
+    on its own, since a selection list merges duplicate and overlapping
+    entries. This keeps duplicate nodes or multiple paths to the same
+    instanced node aligned with their result.
+
+    Args:
+        nodes (list): the names of the nodes to retrieve the attribute from
+
+    Returns:
+        list: the id per node, None when the node has no id or is invalid
+
+    """
+
+    sel = om.MSelectionList()
+    fn = om.MFnDependencyNode()
+    ids = []
+    for node in nodes:
+        sel.clear()
+        try:
+            sel.add(node)
+        except (RuntimeError, TypeError):
+            # Return no id for None, like `get_id`, and missing nodes
+            ids.append(None)
+            continue
+
+        fn.setObject(sel.getDependNode(0))
+        if not fn.hasAttribute("cbId"):
+            ids.append(None)
+            continue
+
+        try:
+            ids.append(fn.findPlug("cbId", False).asString())
+        except RuntimeError:
+            log.warning("Failed to retrieve cbId on %s", node)
+            ids.append(None)
+
+    return ids
+
+
+def get_nodes_by_id(ids=None):
+    """Return the nodes in the scene per `cbId`
+
+    This iterates the scene once through the API to avoid a Maya command
+    per node, which is considerably faster for scenes with many nodes.
+
+    Args:
+        ids (set, optional): When provided only nodes with these ids are
+            returned.
+
+    Returns:
+        dict: The long names of the nodes per `cbId`
+
+    """
+
+    nodes_by_id = defaultdict(list)
+
+    fn = om.MFnDependencyNode()
+    iterator = om.MItDependencyNodes()
+    while not iterator.isDone():
+        mobject = iterator.thisNode()
+        iterator.next()
+
+        fn.setObject(mobject)
+        if not fn.hasAttribute("cbId"):
+            continue
+
+        node_id = fn.findPlug("cbId", False).asString()
+        if ids is not None and node_id not in ids:
+            continue
+
+        if mobject.hasFn(om.MFn.kDagNode):
+            node = om.MDagPath.getAPathTo(mobject).fullPathName()
+        else:
+            node = fn.name()
+
+        nodes_by_id[node_id].append(node)
+
+    return nodes_by_id
+
+
 def generate_ids(nodes, asset_id=None):
     """Returns new unique ids for the given nodes.
 
@@ -2101,7 +2273,7 @@ def get_attr_in_layer(attr, layer):
 
     """
 
-    if cmds.mayaHasRenderSetup():
+    if has_render_setup():
         log.debug("lib.get_attr_in_layer is not optimized for render setup")
         with renderlayer(layer):
             return cmds.getAttr(attr)
@@ -2162,3 +2334,29 @@ def get_attr_in_layer(attr, layer):
                     return value
 
     return cmds.getAttr(attr)
+
+
+def get_attrs_in_layer(attrs, layer):
+    """Return the values of multiple attributes in specified renderlayer.
+
+    This is the same as `get_attr_in_layer` for each of the attributes,
+    except that with render setup the layer is switched to only once for
+    all of the attributes instead of once per attribute.
+
+    Args:
+        attrs (list): attribute names, ex. ["node.attribute"]
+        layer (str): layer name
+
+    Returns:
+        list: The values of the attributes, in order of `attrs`
+
+    """
+
+    if not attrs:
+        return []
+
+    if has_render_setup():
+        with renderlayer(layer):
+            return [cmds.getAttr(attr) for attr in attrs]
+
+    return [get_attr_in_layer(attr, layer=layer) for attr in attrs]
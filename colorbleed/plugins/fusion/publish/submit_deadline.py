@@ -1,12 +1,11 @@
 import os
-import json
-import getpass
 
 from avalon import api
-from avalon.vendor import requests
 
 import pyblish.api
 
+import colorbleed.deadline as deadline
+
 
 class FusionSubmitDeadline(pyblish.api.InstancePlugin):
     """Submit current Comp to Deadline
@@ -57,7 +56,7 @@ class FusionSubmitDeadline(pyblish.api.InstancePlugin):
         filepath = context.data["currentFile"]
         filename = os.path.basename(filepath)
         comment = context.data.get("comment", "")
-        deadline_user = context.data.get("deadlineUser", getpass.getuser())
+        deadline_user = deadline.get_user(context)
 
         # Support code prefix label for batch name
         batch_name = filename
@@ -133,19 +132,16 @@ class FusionSubmitDeadline(pyblish.api.InstancePlugin):
         environment = dict({key: os.environ[key] for key in keys
                             if key in os.environ}, **api.Session)
 
-        payload["JobInfo"].update({
-            "EnvironmentKeyValue%d" % index: "{key}={value}".format(
-                key=key,
-                value=environment[key]
-            ) for index, key in enumerate(environment)
-        })
+        payload["JobInfo"].update(deadline.environment_job_info(environment))
 
         self.log.info("Submitting..")
-        self.log.info(json.dumps(payload, indent=4, sort_keys=True))
+        # Serialize once for both logging and submission
+        body = deadline.serialize(payload)
+        self.log.debug(body)
 
         # E.g. http://192.168.0.1:8082/api/jobs
         url = "{}/api/jobs".format(AVALON_DEADLINE)
-        response = requests.post(url, json=payload)
+        response = deadline.post(url, body)
         if not response.ok:
             raise Exception(response.text)
 
@@ -3,6 +3,7 @@ import re
 import copy
 import json
 import pprint
+import logging
 
 import pyblish.api
 from avalon import api
@@ -180,5 +181,7 @@ class CollectFileSequences(pyblish.api.ContextPlugin):
                 })
                 instance.append(collection)
 
-                self.log.debug("Collected instance:\n"
-                               "{}".format(pprint.pformat(instance.data)))
+                # Only format the instance data when it will be logged
+                if self.log.isEnabledFor(logging.DEBUG):
+                    self.log.debug("Collected instance:\n%s",
+                                   pprint.pformat(instance.data))
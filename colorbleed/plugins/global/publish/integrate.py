@@ -3,6 +3,8 @@ import logging
 import shutil
 
 import errno
+from multiprocessing.pool import ThreadPool
+
 import pyblish.api
 from avalon import api, io
 
@@ -38,6 +40,9 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 "colorbleed.yetiRig",
                 "colorbleed.yeticache"]
 
+    # Maximum amount of files copied concurrently
+    max_copy_threads = 8
+
     def process(self, instance):
 
         self.register(instance)
@@ -236,27 +241,45 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
 
         Through `instance.data["transfers"]`
 
+        The destination folders are created up front after which the files
+        are copied concurrently, as the copies are bound by disk and network
+        I/O rather than CPU.
+
         Args:
             instance: the instance to integrate
         """
 
         transfers = instance.data["transfers"]
+        if not transfers:
+            return
 
-        for src, dest in transfers:
-            self.log.info("Copying file .. {} -> {}".format(src, dest))
-            self.copy_file(src, dest)
+        # Create each destination folder only once and before copying so the
+        # concurrent copies do not race to create the same folders
+        for dirname in set(os.path.dirname(dst) for _, dst in transfers):
+            self.create_dir(dirname)
 
-    def copy_file(self, src, dst):
-        """ Copy given source to destination
+        def _copy(transfer):
+            src, dst = transfer
+            self.log.info("Copying file .. {} -> {}".format(src, dst))
+            self.copy_file(src, dst)
+
+        pool = ThreadPool(min(self.max_copy_threads, len(transfers)))
+        try:
+            # Any exception raised in a copy is re-raised here
+            pool.map(_copy, transfers)
+        finally:
+            pool.close()
+            pool.join()
+
+    def create_dir(self, dirname):
+        """Create the directory if it does not exist yet
 
         Arguments:
-            src (str): the source file which needs to be copied
-            dst (str): the destination of the sourc file
+            dirname (str): the directory to create
         Returns:
             None
         """
 
-        dirname = os.path.dirname(dst)
         try:
             os.makedirs(dirname)
         except OSError as e:
@@ -266,7 +289,39 @@ class IntegrateAsset(pyblish.api.InstancePlugin):
                 self.log.critical("An unexpected error occurred.")
                 raise
 
-        shutil.copy(src, dst)
+    def copy_file(self, src, dst):
+        """ Copy given source to destination
+
+        The destination folder must already exist, see `create_dir`.
+
+        When the destination already exists with the same size and exactly
+        the same modification time as the source the copy is skipped. The
+        file's modification time is preserved on copy to allow this
+        comparison. Filesystems with a coarse modification time, e.g. some
+        network shares, may not store the exact time and then the file is
+        always copied. This trades a redundant copy for never keeping stale
+        content of a republished file with the same size.
+
+        Arguments:
+            src (str): the source file which needs to be copied
+            dst (str): the destination of the sourc file
+        Returns:
+            None
+        """
+
+        try:
+            dst_stat = os.stat(dst)
+        except OSError:
+            # Destination does not exist
+            pass
+        else:
+            src_stat = os.stat(src)
+            if (dst_stat.st_size == src_stat.st_size and
+                    dst_stat.st_mtime == src_stat.st_mtime):
+                self.log.info("Unchanged, skipping copy .. {}".format(dst))
+                return
+
+        shutil.copy2(src, dst)
 
     def get_subset(self, asset, instance):
 
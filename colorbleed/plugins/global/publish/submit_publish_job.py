@@ -4,13 +4,29 @@ import pprint
 import re
 
 from avalon import api, io
-from avalon.vendor import requests, clique
+from avalon.vendor import clique
 
 import pyblish.api
 
+import colorbleed.deadline as deadline
+from colorbleed.plugin import contextplugin_should_run
+
+
+# Path to the image sequence script, resolved on first use
+_script_path = None
+
 
 def _get_script():
-    """Get path to the image sequence script"""
+    """Get path to the image sequence script
+
+    The path is resolved only once and cached for subsequent calls.
+
+    """
+    global _script_path
+
+    if _script_path is not None:
+        return _script_path
+
     try:
         from colorbleed.scripts import publish_filesequence
     except Exception as e:
@@ -21,6 +37,7 @@ def _get_script():
     if module_path.endswith(".pyc"):
         module_path = module_path[:-len(".pyc")] + ".py"
 
+    _script_path = module_path
     return module_path
 
 
@@ -91,7 +108,7 @@ def get_resource_files(resources, frame_range, override=True):
     return list(res_collection)
 
 
-class SubmitDependentImageSequenceJobDeadline(pyblish.api.InstancePlugin):
+class SubmitDependentImageSequenceJobDeadline(pyblish.api.ContextPlugin):
     """Submit image sequence publish jobs to Deadline.
 
     These jobs are dependent on a deadline job submission prior to this
@@ -118,6 +135,10 @@ class SubmitDependentImageSequenceJobDeadline(pyblish.api.InstancePlugin):
     This requires a "startFrame" and "endFrame" to be present in instance.data
     or in context.data.
 
+    The publish jobs of all instances are submitted with a request per job.
+    Instances without a prior deadline job submission fail the plug-in
+    after the publish jobs of the other instances are submitted.
+
     """
 
     label = "Submit image sequence jobs to Deadline"
@@ -127,17 +148,109 @@ class SubmitDependentImageSequenceJobDeadline(pyblish.api.InstancePlugin):
                 "colorbleed.renderlayer",
                 "colorbleed.vrayscene"]
 
-    def process(self, instance):
+    def process(self, context):
+
+        if not contextplugin_should_run(self, context):
+            return
 
         AVALON_DEADLINE = api.Session.get("AVALON_DEADLINE",
                                           "http://localhost:8082")
         assert AVALON_DEADLINE, "Requires AVALON_DEADLINE"
 
-        # Get a submission job
-        job = instance.data.get("deadlineSubmissionJob")
-        if not job:
+        # Collect all active instances of the families
+        families = set(self.families)
+        instances = []
+        missing = []
+        for instance in context:
+            if (not instance.data.get("publish", True) or
+                    not instance.data.get("active", True)):
+                continue
+
+            instance_families = set(instance.data.get("families", []))
+            instance_families.add(instance.data.get("family"))
+            if not families.intersection(instance_families):
+                continue
+
+            if not instance.data.get("deadlineSubmissionJob"):
+                # V-Ray scenes intentionally have no job to publish when
+                # their render or publish job is suspended
+                if ("colorbleed.vrayscene" in instance_families and
+                        (instance.data.get("suspendRenderJob") or
+                         instance.data.get("suspendPublishJob"))):
+                    self.log.info("Skipping %s, its render or publish job "
+                                  "is suspended." % instance.name)
+                else:
+                    missing.append(instance.name)
+                continue
+
+            instances.append(instance)
+
+        if not instances:
+            self.raise_missing(missing)
+            return
+
+        payloads = []
+        resources = []
+        for instance in instances:
+            payload, instance_resources = self.build_payload(instance)
+            payloads.append(payload)
+            resources.append(instance_resources)
+
+        self.log.info("Submitting..")
+        url = "{}/api/jobs".format(AVALON_DEADLINE)
+        deadline.submit_jobs(url, payloads)
+
+        # Copy files from previous render if extendFrame is True
+        for instance, instance_resources in zip(instances, resources):
+            if not instance.data.get("extendFrames", False):
+                continue
+
+            self.log.info("Preparing to copy ..")
+            import shutil
+
+            dest_path = instance.data["outputDir"]
+            for source in instance_resources:
+                src_file = os.path.basename(source)
+                dest = os.path.join(dest_path, src_file)
+                shutil.copy(source, dest)
+
+            self.log.info("Finished copying %i files"
+                          % len(instance_resources))
+
+        self.raise_missing(missing)
+
+    def raise_missing(self, missing):
+        """Raise an error for the instances without a submission job
+
+        This is done after the publish jobs of the other instances are
+        submitted so a single failed instance does not block the others.
+
+        Args:
+            missing (list): The names of the instances without a job.
+
+        """
+        if missing:
             raise RuntimeError("Can't continue without valid deadline "
-                               "submission prior to this plug-in.")
+                               "submission prior to this plug-in: "
+                               "%s" % ", ".join(missing))
+
+    def build_payload(self, instance):
+        """Return the publish job payload for the instance
+
+        This also writes the metadata file for the publish job.
+
+        Args:
+            instance (pyblish.api.Instance): The instance with the render
+                job that the publish job depends on.
+
+        Returns:
+            tuple: The JSON serialized job payload and the list of files of
+                the previous render to copy when extending frames.
+
+        """
+
+        # Get a submission job
+        job = instance.data["deadlineSubmissionJob"]
 
         data = instance.data.copy()
         subset = data["subset"]
@@ -295,35 +408,14 @@ class SubmitDependentImageSequenceJobDeadline(pyblish.api.InstancePlugin):
         # Transfer the environment from the original job to this dependent
         # job so they use the same environment
         environment = job["Props"].get("Env", {})
-        payload["JobInfo"].update({
-            "EnvironmentKeyValue%d" % index: "{key}={value}".format(
-                key=key,
-                value=environment[key]
-            ) for index, key in enumerate(environment)
-        })
+        payload["JobInfo"].update(deadline.environment_job_info(environment))
 
         # Avoid copied pools and remove secondary pool
         payload["JobInfo"]["Pool"] = "none"
         payload["JobInfo"].pop("SecondaryPool", None)
 
-        self.log.info("Submitting..")
-        self.log.info(json.dumps(payload, indent=4, sort_keys=True))
-
-        url = "{}/api/jobs".format(AVALON_DEADLINE)
-        response = requests.post(url, json=payload)
-        if not response.ok:
-            raise Exception(response.text)
-
-        # Copy files from previous render if extendFrame is True
-        if data.get("extendFrames", False):
-
-            self.log.info("Preparing to copy ..")
-            import shutil
-
-            dest_path = data["outputDir"]
-            for source in resources:
-                src_file = os.path.basename(source)
-                dest = os.path.join(dest_path, src_file)
-                shutil.copy(source, dest)
+        # Serialize once for both logging and submission
+        body = deadline.serialize(payload)
+        self.log.debug(body)
 
-            self.log.info("Finished copying %i files" % len(resources))
+        return body, resources
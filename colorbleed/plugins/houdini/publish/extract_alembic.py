@@ -37,7 +37,4 @@ class ExtractAlembic(colorbleed.api.Extractor):
             traceback.print_exc()
             raise RuntimeError("Render failed: {0}".format(exc))
 
-        if "files" not in instance.data:
-            instance.data["files"] = []
-
-        instance.data["files"].append(file_name)
+        instance.data.setdefault("files", []).append(file_name)
@@ -35,9 +35,6 @@ class ExtractVDBCache(colorbleed.api.Extractor):
             traceback.print_exc()
             raise RuntimeError("Render failed: {0}".format(exc))
 
-        if "files" not in instance.data:
-            instance.data["files"] = []
-
         output = instance.data["frames"]
 
-        instance.data["files"].append(output)
+        instance.data.setdefault("files", []).append(output)
@@ -42,12 +42,12 @@ class ValidateFileExtension(pyblish.api.InstancePlugin):
         # Get ROP node from instance
         node = instance[0]
 
-        # Create lookup for current family in instance
-        families = instance.data.get("families", list())
+        # Create lookup for current family in instance, without changing
+        # the families list of the instance itself
+        families = set(instance.data.get("families", list()))
         family = instance.data.get("family", None)
         if family:
-            families.append(family)
-        families = set(families)
+            families.add(family)
 
         # Perform extension check
         output = lib.get_output_parameter(node).eval()
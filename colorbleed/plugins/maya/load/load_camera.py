@@ -14,6 +14,7 @@ class CameraLoader(colorbleed.maya.plugin.ReferenceLoader):
     def process_reference(self, context, name, namespace, data):
 
         import maya.cmds as cmds
+        from colorbleed.maya.lib import get_maya_version
         # Get family type from the context
 
         cmds.loadPlugin("AbcImport.mll", quiet=True)
@@ -29,7 +30,7 @@ class CameraLoader(colorbleed.maya.plugin.ReferenceLoader):
 
         # Check the Maya version, lockTransform has been introduced since
         # Maya 2016.5 Ext 2
-        version = int(cmds.about(version=True))
+        version = int(get_maya_version())
         if version >= 2016:
             for camera in cameras:
                 cmds.camera(camera, edit=True, lockTransform=True)
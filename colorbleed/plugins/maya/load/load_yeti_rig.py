@@ -5,7 +5,7 @@ class YetiRigLoader(colorbleed.maya.plugin.ReferenceLoader):
     """Load a Yeti Rig for simulations"""
 
     families = ["colorbleed.yetiRig"]
-    representations = ["ma"]
+    representations = ["ma", "mb"]
 
     label = "Load Yeti Rig"
     order = -9
@@ -1,6 +1,7 @@
 import re
 import os
 import glob
+import fnmatch
 
 from maya import cmds
 import pyblish.api
@@ -18,6 +19,21 @@ SHAPE_ATTRS = ["castsShadows",
 
 SHAPE_ATTRS = set(SHAPE_ATTRS)
 
+# Tokens in a file path that denote an image sequence, used to convert
+# the path to a glob pattern. The <u> and <v> tokens are only matched as
+# part of the u<u>_v<v> token.
+SEQUENCE_TOKENS_RE = re.compile(r"<udim>|<tile>|<uvtile>|#|<f>|<frame0\d+>|"
+                                r"(?<=u)<u>(?=_v<v>)|(?<=u<u>_v)<v>",
+                                re.IGNORECASE)
+
+# Tokens in a file path that imply an image sequence
+SEQUENCE_PATTERN_RE = re.compile(r"<udim>|<tile>|<uvtile>|u<u>_v<v>|<f>|"
+                                 r"<frame0",
+                                 re.IGNORECASE)
+
+# Cache of whether file nodes have an attribute, see file_node_has_attribute
+_file_node_attributes = {}
+
 
 def get_look_attrs(node):
     """Returns attributes of a node that are important for the look.
@@ -51,7 +67,7 @@ def get_look_attrs(node):
     return result
 
 
-def node_uses_image_sequence(node):
+def node_uses_image_sequence(node, node_path=None):
     """Return whether file node uses an image sequence or single image.
 
     Determine if a node uses an image sequence or just a single image,
@@ -59,6 +75,8 @@ def node_uses_image_sequence(node):
 
     Args:
         node (str): Name of the Maya node
+        node_path (str, optional): The file path of the node, when already
+            known this avoids querying it again.
 
     Returns:
         bool: True if node uses an image sequence
@@ -66,13 +84,11 @@ def node_uses_image_sequence(node):
     """
 
     # useFrameExtension indicates an explicit image sequence
-    node_path = get_file_node_path(node).lower()
-
-    # The following tokens imply a sequence
-    patterns = ["<udim>", "<tile>", "<uvtile>", "u<u>_v<v>", "<frame0"]
+    if node_path is None:
+        node_path = get_file_node_path(node)
 
     return (cmds.getAttr('%s.useFrameExtension' % node) or
-            any(pattern in node_path for pattern in patterns))
+            bool(SEQUENCE_PATTERN_RE.search(node_path)))
 
 
 def seq_to_glob(path):
@@ -97,24 +113,8 @@ def seq_to_glob(path):
         return path
 
     # If any of the patterns, convert the pattern
-    patterns = {
-        "<udim>": "<udim>",
-        "<tile>": "<tile>",
-        "<uvtile>": "<uvtile>",
-        "#": "#",
-        "u<u>_v<v>": "<u>|<v>",
-        "<frame0": "<frame0\d+>",
-        "<f>": "<f>"
-    }
-
-    lower = path.lower()
-    has_pattern = False
-    for pattern, regex_pattern in patterns.items():
-        if pattern in lower:
-            path = re.sub(regex_pattern, "*", path, flags=re.IGNORECASE)
-            has_pattern = True
-
-    if has_pattern:
+    path, count = SEQUENCE_TOKENS_RE.subn("*", path)
+    if count:
         return path
 
     base = os.path.basename(path)
@@ -129,6 +129,27 @@ def seq_to_glob(path):
         return path
 
 
+def file_node_has_attribute(attr):
+    """Return whether the attribute exists on the file node type
+
+    The result is cached per attribute, because it only depends on the
+    Maya version and not on the individual file node.
+
+    Args:
+        attr (str): Name of the attribute
+
+    Returns:
+        bool: True if file nodes have the attribute
+
+    """
+
+    if attr not in _file_node_attributes:
+        exists = cmds.attributeQuery(attr, type="file", exists=True)
+        _file_node_attributes[attr] = exists
+
+    return _file_node_attributes[attr]
+
+
 def get_file_node_path(node):
     """Get the file path used by a Maya file node.
 
@@ -141,43 +162,71 @@ def get_file_node_path(node):
     """
     # if the path appears to be sequence, use computedFileTextureNamePattern,
     # this preserves the <> tag
-    if cmds.attributeQuery('computedFileTextureNamePattern',
-                           node=node,
-                           exists=True):
+    if file_node_has_attribute('computedFileTextureNamePattern'):
         plug = '{0}.computedFileTextureNamePattern'.format(node)
         texture_pattern = cmds.getAttr(plug)
-
-        patterns = ["<udim>",
-                    "<tile>",
-                    "u<u>_v<v>",
-                    "<f>",
-                    "<frame0",
-                    "<uvtile>"]
-        lower = texture_pattern.lower()
-        if any(pattern in lower for pattern in patterns):
+        if SEQUENCE_PATTERN_RE.search(texture_pattern):
             return texture_pattern
 
     # otherwise use fileTextureName
     return cmds.getAttr('{0}.fileTextureName'.format(node))
 
 
-def get_file_node_files(node):
+def glob_files(pattern, dir_cache=None):
+    """Return the files matching the glob pattern
+
+    When a cache is passed the contents of each directory are listed only
+    once and matched against the filename pattern. This avoids listing
+    the same directory again for each pattern, e.g. for many textures
+    in a single folder.
+
+    Args:
+        pattern (str): The glob pattern
+        dir_cache (dict, optional): Directory contents per directory,
+            shared between calls.
+
+    Returns:
+        list: List of full file paths.
+
+    """
+
+    head, tail = os.path.split(pattern)
+    if dir_cache is None or glob.has_magic(head):
+        return glob.glob(pattern)
+
+    if head not in dir_cache:
+        dir_cache[head] = os.listdir(head) if os.path.isdir(head) else []
+    names = dir_cache[head]
+
+    # Like glob, only match hidden files when explicitly requested
+    if not tail.startswith("."):
+        names = [name for name in names if not name.startswith(".")]
+
+    return [os.path.join(head, name) for name in fnmatch.filter(names, tail)]
+
+
+def get_file_node_files(node, dir_cache=None):
     """Return the file paths related to the file node
 
     Note:
         Will only return existing files. Returns an empty list
         if not valid existing files are linked.
 
+    Args:
+        node (str): Name of the Maya file node
+        dir_cache (dict, optional): Directory contents per directory,
+            shared between calls, see `glob_files`.
+
     Returns:
         list: List of full file paths.
 
     """
 
-    path = get_file_node_path(node)
-    path = cmds.workspace(expandName=path)
-    if node_uses_image_sequence(node):
+    node_path = get_file_node_path(node)
+    path = cmds.workspace(expandName=node_path)
+    if node_uses_image_sequence(node, node_path):
         glob_pattern = seq_to_glob(path)
-        return glob.glob(glob_pattern)
+        return glob_files(glob_pattern, dir_cache)
     elif os.path.exists(path):
         return [path]
     else:
@@ -264,8 +313,10 @@ class CollectLook(pyblish.api.InstancePlugin):
             history = cmds.listHistory(looksets)
             files = cmds.ls(history, type="file", long=True)
 
-        # Collect textures if any file nodes are found
-        instance.data["resources"] = [self.collect_resource(n)
+        # Collect textures if any file nodes are found, the directories of
+        # the image sequences are listed only once for all file nodes
+        dir_cache = {}
+        instance.data["resources"] = [self.collect_resource(n, dir_cache)
                                       for n in files]
 
         # Log a warning when no relevant sets were retrieved for the look.
@@ -375,10 +426,12 @@ class CollectLook(pyblish.api.InstancePlugin):
 
         return attributes
 
-    def collect_resource(self, node):
+    def collect_resource(self, node, dir_cache=None):
         """Collect the link to the file(s) used (resource)
         Args:
             node (str): name of the node
+            dir_cache (dict, optional): Directory contents per directory,
+                shared between the file nodes.
 
         Returns:
             dict
@@ -404,7 +457,7 @@ class CollectLook(pyblish.api.InstancePlugin):
         # paths as the computed patterns
         source = source.replace("\\", "/")
 
-        files = get_file_node_files(node)
+        files = get_file_node_files(node, dir_cache)
         if len(files) == 0:
             self.log.error("No valid files found from node `%s`" % node)
         elif len(files) == 1 and not os.path.isfile(files[0]):
@@ -55,9 +55,11 @@ class CollectRenderLayerAOVS(pyblish.api.InstancePlugin):
         render_elements = cmds.ls(type=node_type)
 
         # Check if AOVs / Render Elements are enabled
-        for element in render_elements:
-            enabled = lib.get_attr_in_layer("{}.enabled".format(element),
-                                            layer=layer)
+        enabled_states = lib.get_attrs_in_layer(
+            ["{}.enabled".format(element) for element in render_elements],
+            layer=layer
+        )
+        for element, enabled in zip(render_elements, enabled_states):
             if not enabled:
                 continue
 
@@ -18,8 +18,9 @@ class CollectRenderableCamera(pyblish.api.InstancePlugin):
         layer = instance.data["setMembers"]
 
         cameras = cmds.ls(type="camera", long=True)
-        renderable = [c for c in cameras if
-                      lib.get_attr_in_layer("%s.renderable" % c, layer=layer)]
+        values = lib.get_attrs_in_layer(["%s.renderable" % c for c in cameras],
+                                        layer=layer)
+        renderable = [c for c, value in zip(cameras, values) if value]
 
         self.log.info("Found cameras %s: %s" % (len(renderable), renderable))
 
@@ -33,9 +33,10 @@ class CollectMayaRenderlayers(pyblish.api.ContextPlugin):
         valid_layers = set(connected_layers)
 
         # Get all renderlayers and check their state
-        renderlayers = [i for i in cmds.ls(type="renderLayer") if
-                        cmds.getAttr("{}.renderable".format(i)) and not
-                        cmds.referenceQuery(i, isNodeReferenced=True)]
+        layers = cmds.ls(type="renderLayer")
+        referenced = set(cmds.ls(layers, referencedNodes=True))
+        renderlayers = [i for i in layers if i not in referenced and
+                        cmds.getAttr("{}.renderable".format(i))]
 
         # Sort by displayOrder
         def sort_by_display_order(layer):
@@ -57,18 +58,18 @@ class CollectMayaRenderlayers(pyblish.api.ContextPlugin):
                 layername = layer.split("rs_", 1)[-1]
 
             # Get layer specific settings, might be overrides
+            start, end, step, renderer = self.get_render_attributes(
+                ["startFrame", "endFrame", "byFrameStep", "currentRenderer"],
+                layer=layer
+            )
             data = {
                 "subset": layername,
                 "setMembers": layer,
                 "publish": True,
-                "startFrame": self.get_render_attribute("startFrame",
-                                                        layer=layer),
-                "endFrame": self.get_render_attribute("endFrame",
-                                                      layer=layer),
-                "byFrameStep": self.get_render_attribute("byFrameStep",
-                                                         layer=layer),
-                "renderer": self.get_render_attribute("currentRenderer",
-                                                      layer=layer),
+                "startFrame": start,
+                "endFrame": end,
+                "byFrameStep": step,
+                "renderer": renderer,
 
                 # instance subset
                 "family": "Render Layers",
@@ -110,9 +111,10 @@ class CollectMayaRenderlayers(pyblish.api.ContextPlugin):
             instance.data["label"] = label
             instance.data.update(data)
 
-    def get_render_attribute(self, attr, layer):
-        return lib.get_attr_in_layer("defaultRenderGlobals.{}".format(attr),
-                                     layer=layer)
+    def get_render_attributes(self, attrs, layer):
+        return lib.get_attrs_in_layer(["defaultRenderGlobals.{}".format(attr)
+                                       for attr in attrs],
+                                      layer=layer)
 
     def parse_options(self, render_globals):
         """Get all overrides with a value, skip those without
@@ -67,9 +67,10 @@ class CollectVRayScene(pyblish.api.ContextPlugin):
         extension = cmds.getAttr("vraySettings.imageFormatStr")
 
         # Get render layers
-        render_layers = [i for i in cmds.ls(type="renderLayer") if
-                         cmds.getAttr("{}.renderable".format(i)) and not
-                         cmds.referenceQuery(i, isNodeReferenced=True)]
+        layers = cmds.ls(type="renderLayer")
+        referenced = set(cmds.ls(layers, referencedNodes=True))
+        render_layers = [i for i in layers if i not in referenced and
+                         cmds.getAttr("{}.renderable".format(i))]
 
         render_layers = sorted(render_layers, key=sort_by_display_order)
         for layer in render_layers:
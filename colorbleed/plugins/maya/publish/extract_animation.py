@@ -4,7 +4,7 @@ from maya import cmds
 
 import avalon.maya
 import colorbleed.api
-from colorbleed.maya.lib import extract_alembic
+from colorbleed.maya.lib import extract_alembic, get_maya_version
 
 
 class ExtractColorbleedAnimation(colorbleed.api.Extractor):
@@ -43,11 +43,9 @@ class ExtractColorbleedAnimation(colorbleed.api.Extractor):
             end += handles
 
         self.log.info("Extracting animation..")
-        dirname = self.staging_dir(instance)
-
-        parent_dir = self.staging_dir(instance)
+        stagingdir = self.staging_dir(instance)
         filename = "{name}.abc".format(**instance.data)
-        path = os.path.join(parent_dir, filename)
+        path = os.path.join(stagingdir, filename)
 
         options = {
             "step": instance.data.get("step", 1.0),
@@ -66,7 +64,7 @@ class ExtractColorbleedAnimation(colorbleed.api.Extractor):
             # direct members of the set
             options["root"] = roots
 
-        if int(cmds.about(version=True)) >= 2017:
+        if int(get_maya_version()) >= 2017:
             # Since Maya 2017 alembic supports multiple uv sets - write them.
             options["writeUVSets"] = True
 
@@ -78,9 +76,6 @@ class ExtractColorbleedAnimation(colorbleed.api.Extractor):
                                 endFrame=end,
                                 **options)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
-        self.log.info("Extracted {} to {}".format(instance, dirname))
+        self.log.info("Extracted {} to {}".format(instance, stagingdir))
@@ -74,10 +74,7 @@ class ExtractCameraAlembic(colorbleed.api.Extractor):
                 with avalon.maya.suspended_refresh():
                     cmds.AbcExport(j=job_str, verbose=False)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extracted instance '{0}' to: {1}".format(
             instance.name, path))
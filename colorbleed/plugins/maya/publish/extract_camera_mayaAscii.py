@@ -168,10 +168,7 @@ class ExtractCameraMayaAscii(colorbleed.api.Extractor):
 
                     massage_ma_file(path)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extracted instance '{0}' to: {1}".format(
             instance.name, path))
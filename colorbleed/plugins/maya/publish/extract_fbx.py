@@ -7,6 +7,7 @@ import pyblish.api
 import avalon.maya
 
 import colorbleed.api
+import colorbleed.maya.lib as lib
 
 
 class ExtractFBX(colorbleed.api.Extractor):
@@ -143,7 +144,7 @@ class ExtractFBX(colorbleed.api.Extractor):
     def process(self, instance):
 
         # Ensure FBX plug-in is loaded
-        cmds.loadPlugin("fbxmaya", quiet=True)
+        lib.load_plugin("fbxmaya")
 
         # Define output path
         directory = self.staging_dir(instance)
@@ -183,7 +184,7 @@ class ExtractFBX(colorbleed.api.Extractor):
         # Apply the FBX overrides through MEL since the commands
         # only work correctly in MEL according to online
         # available discussions on the topic
-        for option, value in options.iteritems():
+        for option, value in options.items():
             key = option[0].upper() + option[1:]  # uppercase first letter
 
             # Boolean must be passed as lower-case strings
@@ -208,9 +209,6 @@ class ExtractFBX(colorbleed.api.Extractor):
             cmds.select(members, r=1, noExpand=True)
             mel.eval('FBXExport -f "{}" -s'.format(path))
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extract FBX successful to: {0}".format(path))
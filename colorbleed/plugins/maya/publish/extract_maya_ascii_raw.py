@@ -49,9 +49,6 @@ class ExtractMayaAsciiRaw(colorbleed.api.Extractor):
                       constraints=True,
                       expressions=True)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extracted instance '%s' to: %s" % (instance.name, path))
@@ -69,9 +69,6 @@ class ExtractModel(colorbleed.api.Extractor):
 
                         # Store reference for integration
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extracted instance '%s' to: %s" % (instance.name, path))
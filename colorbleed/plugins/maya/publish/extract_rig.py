@@ -34,9 +34,6 @@ class ExtractColorbleedRig(colorbleed.api.Extractor):
                       expressions=True,
                       constructionHistory=True)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(filename)
+        instance.data.setdefault("files", []).append(filename)
 
         self.log.info("Extracted instance '%s' to: %s" % (instance.name, path))
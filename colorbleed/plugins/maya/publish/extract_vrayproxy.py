@@ -54,10 +54,7 @@ class ExtractVRayProxy(colorbleed.api.Extractor):
                                  ignoreHiddenObjects=True,
                                  createProxyNode=False)
 
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].append(file_name)
+        instance.data.setdefault("files", []).append(file_name)
 
         self.log.info("Extracted instance '%s' to: %s"
                       % (instance.name, staging_dir))
@@ -61,12 +61,11 @@ class ExtractYetiCache(colorbleed.api.Extractor):
         settings = instance.data.get("fursettings", None)
         if settings is not None:
             with open(data_file, "w") as fp:
-                json.dump(settings, fp, ensure_ascii=False)
+                # Write in a single call instead of many small writes
+                fp.write(json.dumps(settings, ensure_ascii=False))
 
         # Ensure files can be stored
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].extend([cache_files, "yeti.fursettings"])
+        instance.data.setdefault("files", []).extend([cache_files,
+                                                      "yeti.fursettings"])
 
         self.log.info("Extracted {} to {}".format(instance, dirname))
@@ -1,32 +1,45 @@
 import os
 import json
+import logging
 import contextlib
 
 from maya import cmds
 
-import avalon.maya.lib as lib
+import avalon.maya
 import colorbleed.api
 import colorbleed.maya.lib as maya
 
 
+log = logging.getLogger(__name__)
+
+
 @contextlib.contextmanager
 def disconnect_plugs(settings, members):
 
-    members = cmds.ls(members, long=True)
+    members = set(cmds.ls(members, long=True))
+    inputs = settings["inputs"]
+
+    ids = set()
+    for input in inputs:
+        ids.update([input["sourceID"], input["destinationID"]])
+    nodes_by_id = maya.get_nodes_by_id(ids)
+
     original_connections = []
     try:
-        for input in settings["inputs"]:
+        for input in inputs:
 
-            # Get source shapes
-            source_nodes = lib.lsattr("cbId", input["sourceID"])
-            if not source_nodes:
+            # Get source shape outside of the members
+            source_nodes = set(nodes_by_id.get(input["sourceID"], []))
+            source = next(iter(source_nodes - members), None)
+            if source is None:
                 continue
 
-            source = next(s for s in source_nodes if s not in members)
-
-            # Get destination shapes (the shapes used as hook up)
-            destination_nodes = lib.lsattr("cbId", input["destinationID"])
-            destination = next(i for i in destination_nodes if i in members)
+            # Get destination shape (the shape used as hook up)
+            destination_nodes = nodes_by_id.get(input["destinationID"], [])
+            destination = next(iter(members.intersection(destination_nodes)),
+                               None)
+            if destination is None:
+                continue
 
             # Create full connection
             connections = input["connections"]
@@ -56,10 +69,11 @@ def disconnect_plugs(settings, members):
 @contextlib.contextmanager
 def yetigraph_attribute_values(assumed_destination, resources):
 
+    # Only resources of Yeti graph nodes need their paths remapped
+    graph_resources = [r for r in resources if "graphnode" in r]
+
     try:
-        for resource in resources:
-            if "graphnode" not in resource:
-                continue
+        for resource in graph_resources:
 
             fname = os.path.basename(resource["source"])
             new_fpath = os.path.join(assumed_destination, fname)
@@ -71,30 +85,38 @@ def yetigraph_attribute_values(assumed_destination, resources):
                                  param=resource["param"],
                                  setParamValueString=new_fpath)
             except Exception as exc:
-                print(">>> Exception:", exc)
+                log.warning("Failed to remap %s: %s", resource["source"], exc)
         yield
 
     finally:
-        for resource in resources:
-            if "graphnode" not in resources:
-                continue
-
+        for resource in graph_resources:
             try:
                 cmds.pgYetiGraph(resource["node"],
                                  node=resource["graphnode"],
                                  param=resource["param"],
                                  setParamValue=resource["source"])
-            except RuntimeError:
-                pass
+            except RuntimeError as exc:
+                log.warning("Failed to restore %s: %s",
+                            resource["source"], exc)
 
 
 class ExtractYetiRig(colorbleed.api.Extractor):
-    """Extract the Yeti rig to a MayaAscii and write the Yeti rig data"""
+    """Extract the Yeti rig to a Maya scene and write the Yeti rig data
+
+    The rig is extracted as Maya Binary by default as it writes considerably
+    faster than Maya Ascii for large rigs. Set `yetiRigFormat` on the
+    instance to "mayaAscii" to extract to Maya Ascii instead.
+
+    """
 
     label = "Extract Yeti Rig"
     hosts = ["maya"]
     families = ["colorbleed.yetiRig"]
 
+    # File extension per supported Maya scene type
+    extensions = {"mayaBinary": "mb",
+                  "mayaAscii": "ma"}
+
     def process(self, instance):
 
         yeti_nodes = cmds.ls(instance, type="pgYetiMaya")
@@ -106,7 +128,9 @@ class ExtractYetiRig(colorbleed.api.Extractor):
         settings_path = os.path.join(dirname, "yeti.rigsettings")
 
         # Yeti related staging dirs
-        maya_path = os.path.join(dirname, "yeti_rig.ma")
+        file_type = instance.data.get("yetiRigFormat", "mayaBinary")
+        maya_fname = "yeti_rig.{0}".format(self.extensions[file_type])
+        maya_path = os.path.join(dirname, maya_fname)
 
         self.log.info("Writing metadata file")
 
@@ -124,7 +148,8 @@ class ExtractYetiRig(colorbleed.api.Extractor):
         if settings:
             settings["imageSearchPath"] = image_search_path
             with open(settings_path, "w") as fp:
-                json.dump(settings, fp, ensure_ascii=False)
+                # Write in a single call instead of many small writes
+                fp.write(json.dumps(settings, ensure_ascii=False))
 
         # Ensure the imageSearchPath is being remapped to the publish folder
         attr_value = {"%s.imageSearchPath" % n: str(image_search_path) for
@@ -133,32 +158,35 @@ class ExtractYetiRig(colorbleed.api.Extractor):
         # Get input_SET members
         input_set = next(i for i in instance if i == "input_SET")
 
-        # Get all items
-        set_members = cmds.sets(input_set, query=True)
-        set_members += cmds.listRelatives(set_members,
-                                          allDescendents=True,
-                                          fullPath=True) or []
-        members = cmds.ls(set_members, long=True)
+        # Get all items as unique long names, the descendants are already
+        # listed by their full path so only the set members need converting
+        set_members = cmds.sets(input_set, query=True) or []
+        members = set()
+        if set_members:
+            members.update(cmds.ls(set_members, long=True))
+            members.update(cmds.listRelatives(set_members,
+                                              allDescendents=True,
+                                              fullPath=True) or [])
 
         nodes = instance.data["setMembers"]
         resources = instance.data.get("resources", {})
         with disconnect_plugs(settings, members):
             with yetigraph_attribute_values(destination_folder, resources):
                 with maya.attribute_values(attr_value):
-                    cmds.select(nodes, noExpand=True)
-                    cmds.file(maya_path,
-                              force=True,
-                              exportSelected=True,
-                              typ="mayaAscii",
-                              preserveReferences=False,
-                              constructionHistory=True,
-                              shader=False)
+                    with maya.evaluation("off"):
+                        with avalon.maya.suspended_refresh():
+                            cmds.select(nodes, noExpand=True)
+                            cmds.file(maya_path,
+                                      force=True,
+                                      exportSelected=True,
+                                      typ=file_type,
+                                      preserveReferences=False,
+                                      constructionHistory=True,
+                                      shader=False)
 
         # Ensure files can be stored
-        if "files" not in instance.data:
-            instance.data["files"] = list()
-
-        instance.data["files"].extend(["yeti_rig.ma", "yeti.rigsettings"])
+        instance.data.setdefault("files", []).extend([maya_fname,
+                                                      "yeti.rigsettings"])
 
         self.log.info("Extracted {} to {}".format(instance, dirname))
 
@@ -1,18 +1,17 @@
 import os
-import json
-import getpass
 
 from maya import cmds
 
 from avalon import api
-from avalon.vendor import requests
 
 import pyblish.api
 
 import colorbleed.maya.lib as lib
+import colorbleed.deadline as deadline
+from colorbleed.plugin import contextplugin_should_run
 
 
-def get_renderer_variables(renderlayer=None):
+def get_renderer_variables(renderlayer=None, renderer=None):
     """Retrieve the extension which has been set in the VRay settings
 
     Will return None if the current renderer is not VRay
@@ -21,12 +20,17 @@ def get_renderer_variables(renderlayer=None):
 
     Args:
         renderlayer (str): the node name of the renderlayer.
+        renderer (str, optional): the renderer of the renderlayer, when
+            already known this avoids querying it from the scene.
 
     Returns:
         dict
     """
 
-    renderer = lib.get_renderer(renderlayer or lib.get_current_renderlayer())
+    if renderer is None:
+        layer = renderlayer or lib.get_current_renderlayer()
+        renderer = lib.get_renderer(layer)
+
     render_attrs = lib.RENDER_ATTRS.get(renderer, lib.RENDER_ATTRS["default"])
 
     padding = cmds.getAttr("{}.{}".format(render_attrs["node"],
@@ -88,12 +92,15 @@ def preview_fname(folder, scene, layer, padding, ext):
     return os.path.join(folder, output)
 
 
-class MayaSubmitDeadline(pyblish.api.InstancePlugin):
+class MayaSubmitDeadline(pyblish.api.ContextPlugin):
     """Submit available render layers to Deadline
 
     Renders are submitted to a Deadline Web Service as
     supplied via the environment variable AVALON_DEADLINE
 
+    A job is submitted for each render layer, with a request per job. When
+    there are multiple render layers these requests are sent concurrently.
+
     """
 
     label = "Submit to Deadline"
@@ -101,12 +108,74 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
     hosts = ["maya"]
     families = ["colorbleed.renderlayer"]
 
-    def process(self, instance):
+    # Prefixes of the PATH entries to pass on to the render slaves
+    path_prefixes = ("P:",)
+
+    def process(self, context):
+
+        if not contextplugin_should_run(self, context):
+            return
 
         AVALON_DEADLINE = api.Session.get("AVALON_DEADLINE",
                                           "http://localhost:8082")
         assert AVALON_DEADLINE, "Requires AVALON_DEADLINE"
 
+        # Collect all active render layer instances
+        instances = []
+        for instance in context:
+            if self.families[0] not in instance.data.get("families", []):
+                continue
+
+            if (not instance.data.get("publish", True) or
+                    not instance.data.get("active", True)):
+                continue
+
+            instances.append(instance)
+
+        # Ensure render folder exists, this is shared by all render layers
+        renders = os.path.join(context.data["workspaceDir"], "renders")
+        if instances and not os.path.isdir(renders):
+            os.makedirs(renders)
+
+        # The renderer variables are queried from the scene's current
+        # render settings and only differ per renderer, so they are queried
+        # only once per renderer and shared by the render layers
+        renderer_variables = {}
+
+        # The environment is the same for all render layers, so its JobInfo
+        # keys are built only once
+        environment_info = deadline.environment_job_info(
+            self.get_environment()
+        )
+
+        payloads = [self.build_payload(instance,
+                                       renderer_variables,
+                                       environment_info)
+                    for instance in instances]
+
+        self.log.info("Submitting..")
+
+        # E.g. http://192.168.0.1:8082/api/jobs
+        url = "{}/api/jobs".format(AVALON_DEADLINE)
+        jobs = deadline.submit_jobs(url, payloads)
+
+        for instance, job in zip(instances, jobs):
+            instance.data["deadlineSubmissionJob"] = job
+
+    def build_payload(self, instance, renderer_variables, environment_info):
+        """Return the Deadline job payload for the render layer instance
+
+        Args:
+            instance (pyblish.api.Instance): The render layer instance.
+            renderer_variables (dict): The renderer variables cached per
+                renderer for all instances.
+            environment_info (dict): The environment as JobInfo keys.
+
+        Returns:
+            str: The JSON serialized job payload
+
+        """
+
         context = instance.context
         workspace = context.data["workspaceDir"]
         code = context.data["code"]
@@ -119,7 +188,7 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
         renderlayer_name = instance.data['subset']      # beauty
         renderlayer_globals = instance.data["renderGlobals"]
         legacy_layers = renderlayer_globals["UseLegacyRenderLayers"]
-        deadline_user = context.data.get("deadlineUser", getpass.getuser())
+        deadline_user = deadline.get_user(context)
         jobname = "%s - %s" % (filename, instance.name)
 
         # Support code prefix label for batch name
@@ -128,19 +197,17 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
             batch_name = "{0} - {1}".format(code, batch_name)
 
         # Get the variables depending on the renderer
-        render_variables = get_renderer_variables(renderlayer)
+        renderer = instance.data["renderer"]
+        if renderer not in renderer_variables:
+            variables = get_renderer_variables(renderlayer, renderer)
+            renderer_variables[renderer] = variables
+        render_variables = renderer_variables[renderer]
         output_filename_0 = preview_fname(folder=dirname,
                                           scene=scene,
                                           layer=renderlayer_name,
                                           padding=render_variables["padding"],
                                           ext=render_variables["ext"])
 
-        try:
-            # Ensure render folder exists
-            os.makedirs(dirname)
-        except OSError:
-            pass
-
         # Documentation for keys available at:
         # https://docs.thinkboxsoftware.com
         #    /products/deadline/8.0/1_User%20Manual/manual
@@ -178,7 +245,7 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
                 "OutputFilePrefix": render_variables["filename_prefix"],
 
                 # Mandatory for Deadline
-                "Version": cmds.about(version=True),
+                "Version": lib.get_maya_version(),
 
                 # Only render layers are considered renderable in this pipeline
                 "UsingRenderLayers": True,
@@ -190,7 +257,7 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
                 "RenderLayer": renderlayer,
 
                 # Determine which renderer to use from the file itself
-                "Renderer": instance.data["renderer"],
+                "Renderer": renderer,
 
                 # Resolve relative references
                 "ProjectPath": workspace,
@@ -200,6 +267,34 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
             "AuxFiles": []
         }
 
+        # Include the environment for the render slaves
+        payload["JobInfo"].update(environment_info)
+
+        # Include optional render globals
+        payload["JobInfo"].update(renderlayer_globals)
+
+        plugin = payload["JobInfo"]["Plugin"]
+        self.log.info("using render plugin : {}".format(plugin))
+
+        self.preflight_check(instance)
+
+        # Serialize once for both logging and submission
+        body = deadline.serialize(payload)
+        self.log.debug(body)
+
+        # Store output dir for unified publisher (filesequence)
+        instance.data["outputDir"] = os.path.dirname(output_filename_0)
+
+        return body
+
+    def get_environment(self):
+        """Return the environment to pass on to the render jobs
+
+        Returns:
+            dict: The environment variables
+
+        """
+
         # Include critical environment variables with submission
         keys = [
             # This will trigger `userSetup.py` on the slave
@@ -229,38 +324,13 @@ class MayaSubmitDeadline(pyblish.api.InstancePlugin):
         environment = dict({key: os.environ[key] for key in keys
                             if key in os.environ}, **api.Session)
 
-        PATHS = os.environ["PATH"].split(";")
-        environment["PATH"] = ";".join([p for p in PATHS
-                                        if p.startswith("P:")])
-
-        payload["JobInfo"].update({
-            "EnvironmentKeyValue%d" % index: "{key}={value}".format(
-                key=key,
-                value=environment[key]
-            ) for index, key in enumerate(environment)
-        })
+        # Only pass on the PATH entries that are accessible to the slaves
+        paths = os.environ["PATH"].split(os.pathsep)
+        environment["PATH"] = os.pathsep.join(
+            p for p in paths if p.startswith(self.path_prefixes)
+        )
 
-        # Include optional render globals
-        render_globals = instance.data.get("renderGlobals", {})
-        payload["JobInfo"].update(render_globals)
-
-        plugin = payload["JobInfo"]["Plugin"]
-        self.log.info("using render plugin : {}".format(plugin))
-
-        self.preflight_check(instance)
-
-        self.log.info("Submitting..")
-        self.log.info(json.dumps(payload, indent=4, sort_keys=True))
-
-        # E.g. http://192.168.0.1:8082/api/jobs
-        url = "{}/api/jobs".format(AVALON_DEADLINE)
-        response = requests.post(url, json=payload)
-        if not response.ok:
-            raise Exception(response.text)
-
-        # Store output dir for unified publisher (filesequence)
-        instance.data["outputDir"] = os.path.dirname(output_filename_0)
-        instance.data["deadlineSubmissionJob"] = response.json()
+        return environment
 
     def preflight_check(self, instance):
         """Ensure the startFrame, endFrame and byFrameStep are integers"""
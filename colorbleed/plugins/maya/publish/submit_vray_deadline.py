@@ -1,17 +1,19 @@
-import getpass
-import json
 import os
-from copy import deepcopy
+import re
 
 import pyblish.api
 
 from avalon import api
-from avalon.vendor import requests
 
-from maya import cmds
+import colorbleed.maya.lib as lib
+import colorbleed.deadline as deadline
+from colorbleed.plugin import contextplugin_should_run
 
+# Tokens in the output templates of the vrscene and render jobs
+TOKEN_RE = re.compile(r"<Scene>|<Layer>")
 
-class VraySubmitDeadline(pyblish.api.InstancePlugin):
+
+class VraySubmitDeadline(pyblish.api.ContextPlugin):
     """Export the scene to `.vrscene` files per frame per render layer
 
     vrscene files will be written out based on the following template:
@@ -20,32 +22,126 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
     A dependency job will be added for each layer to render the framer
     through VRay Standalone
 
+    The export jobs of all layers are submitted first, with a request per
+    job. The render jobs are submitted once the ids of the export jobs they
+    depend on are known.
+
     """
     label = "Submit to Deadline ( vrscene )"
     order = pyblish.api.IntegratorOrder
     hosts = ["maya"]
     families = ["colorbleed.vrayscene"]
 
-    def process(self, instance):
+    def process(self, context):
+
+        if not contextplugin_should_run(self, context):
+            return
 
         AVALON_DEADLINE = api.Session.get("AVALON_DEADLINE",
                                           "http://localhost:8082")
         assert AVALON_DEADLINE, "Requires AVALON_DEADLINE"
 
-        context = instance.context
-
         deadline_url = "{}/api/jobs".format(AVALON_DEADLINE)
-        deadline_user = context.data.get("deadlineUser", getpass.getuser())
 
-        code = context.data["code"]
-        filepath = context.data["currentFile"]
-        filename = os.path.basename(filepath)
+        # Collect all active vrayscene instances
+        instances = []
+        for instance in context:
+            if self.families[0] not in instance.data.get("families", []):
+                continue
+
+            if (not instance.data.get("publish", True) or
+                    not instance.data.get("active", True)):
+                continue
+
+            instances.append(instance)
+
+        if not instances:
+            return
+
+        environment = dict(AVALON_TOOLS="global;python36;maya2018")
+        environment.update(api.Session.copy())
+
+        # Primary jobs
+        self.log.info("Submitting export jobs ..")
+        payloads = [self.build_export_payload(instance, environment)
+                    for instance in instances]
+
+        # Store jobs to create dependency chain, the render jobs can only
+        # be built once the export jobs are submitted
+        dependencies = deadline.submit_jobs(deadline_url, payloads)
+
+        # Secondary jobs
+        # Add vray renderslave to environment, all values are strings so
+        # a shallow copy suffices
+        environment_b = dict(environment)
+        environment_b["AVALON_TOOLS"] += ";vrayrenderslave"
+
+        render_instances = []
+        payloads_b = []
+        for instance, dependency in zip(instances, dependencies):
+            if instance.data["suspendRenderJob"]:
+                self.log.info("Skipping render job and publish job "
+                              "for %s", instance)
+                continue
+
+            render_instances.append(instance)
+            payloads_b.append(self.build_render_payload(instance,
+                                                        environment_b,
+                                                        dependency))
+
+        if not payloads_b:
+            return
+
+        self.log.info("Submitting render jobs ..")
+        jobs = deadline.submit_jobs(deadline_url, payloads_b)
+
+        # Add job for publish job
+        for instance, job in zip(render_instances, jobs):
+            if not instance.data.get("suspendPublishJob", False):
+                instance.data["deadlineSubmissionJob"] = job
+
+    def get_job_names(self, instance):
+        """Return the batch name and task name of the instance's jobs
+
+        Args:
+            instance (pyblish.api.Instance): The vrayscene instance.
+
+        Returns:
+            tuple: The batch name and the task name
+
+        """
+
+        context = instance.context
+        filename = os.path.basename(context.data["currentFile"])
+
         task_name = "{} - {}".format(filename, instance.name)
 
         batch_name = "{} - (vrscene)".format(filename)
+        code = context.data["code"]
         if code:
             batch_name = "{0} - {1}".format(code, batch_name)
 
+        return batch_name, task_name
+
+    def build_export_payload(self, instance, environment):
+        """Return the payload of the job to export the vrscene files
+
+        Args:
+            instance (pyblish.api.Instance): The vrayscene instance.
+            environment (dict): The environment variables of the job.
+
+        Returns:
+            str: The JSON serialized job payload
+
+        """
+
+        context = instance.context
+        deadline_user = deadline.get_user(context)
+
+        filepath = context.data["currentFile"]
+        filename = os.path.basename(filepath)
+        batch_name, task_name = self.get_job_names(instance)
+
         # Get the output template for vrscenes
         vrscene_output = instance.data["vrsceneOutput"]
 
@@ -57,9 +153,6 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
         start_frame = int(instance.data["startFrame"])
         end_frame = int(instance.data["endFrame"])
 
-        # Primary job
-        self.log.info("Submitting export job ..")
-
         payload = {
             "JobInfo": {
                 # Top-level group name
@@ -87,7 +180,7 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
                 "Renderer": "vray",
 
                 # Mandatory for Deadline
-                "Version": cmds.about(version=True),
+                "Version": lib.get_maya_version(),
 
                 # Input
                 "SceneFile": filepath,
@@ -103,28 +196,38 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
             "AuxFiles": []
         }
 
-        environment = dict(AVALON_TOOLS="global;python36;maya2018")
-        environment.update(api.Session.copy())
+        payload["JobInfo"].update(deadline.environment_job_info(environment))
 
-        jobinfo_environment = self.build_jobinfo_environment(environment)
+        # Serialize once for both logging and submission
+        body = deadline.serialize(payload)
+        self.log.debug("Job Data:\n%s", body)
 
-        payload["JobInfo"].update(jobinfo_environment)
+        return body
 
-        self.log.info("Job Data:\n{}".format(json.dumps(payload)))
+    def build_render_payload(self, instance, environment, dependency):
+        """Return the payload of the job to render the vrscene files
 
-        response = requests.post(url=deadline_url, json=payload)
-        if not response.ok:
-            raise RuntimeError(response.text)
+        Args:
+            instance (pyblish.api.Instance): The vrayscene instance.
+            environment (dict): The environment variables of the job.
+            dependency (dict): The submitted export job to depend on.
 
-        # Secondary job
-        # Store job to create dependency chain
-        dependency = response.json()
+        Returns:
+            str: The JSON serialized job payload
 
-        if instance.data["suspendRenderJob"]:
-            self.log.info("Skipping render job and publish job")
-            return
+        """
+
+        context = instance.context
+        deadline_user = deadline.get_user(context)
 
-        self.log.info("Submitting render job ..")
+        filename = os.path.basename(context.data["currentFile"])
+        batch_name, task_name = self.get_job_names(instance)
+
+        # The input file is the first file written by the export job
+        vrscene_output = instance.data["vrsceneOutput"]
+        first_file = self.format_output_filename(instance,
+                                                 filename,
+                                                 vrscene_output)
 
         start_frame = int(instance.data["startFrame"])
         end_frame = int(instance.data["endFrame"])
@@ -149,7 +252,7 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
         if not os.path.exists(render_ouput):
             os.makedirs(render_ouput)
 
-        payload_b = {
+        payload = {
             "JobInfo": {
 
                 "JobDependency0": dependency["_id"],
@@ -180,24 +283,12 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
             "AuxFiles": [],
         }
 
-        # Add vray renderslave to environment
-        tools = environment["AVALON_TOOLS"] + ";vrayrenderslave"
-        environment_b = deepcopy(environment)
-        environment_b["AVALON_TOOLS"] = tools
-
-        jobinfo_environment_b = self.build_jobinfo_environment(environment_b)
-        payload_b["JobInfo"].update(jobinfo_environment_b)
+        payload["JobInfo"].update(deadline.environment_job_info(environment))
 
-        self.log.info(json.dumps(payload_b))
+        body = deadline.serialize(payload)
+        self.log.debug(body)
 
-        # Post job to deadline
-        response_b = requests.post(url=deadline_url, json=payload_b)
-        if not response_b.ok:
-            raise RuntimeError(response_b.text)
-
-        # Add job for publish job
-        if not instance.data.get("suspendPublishJob", False):
-            instance.data["deadlineSubmissionJob"] = response_b.json()
+        return body
 
     def build_command(self, instance):
         """Create command for Render.exe to export vray scene
@@ -222,19 +313,6 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
                           endFrame=instance.data["endFrame"],
                           layer=instance.name)
 
-    def build_jobinfo_environment(self, env):
-        """Format environment keys and values to match Deadline rquirements
-
-        Args:
-            env(dict): environment dictionary
-
-        Returns:
-            dict
-
-        """
-        return {"EnvironmentKeyValue%d" % index: "%s=%s" % (k, env[k])
-                for index, k in enumerate(env)}
-
     def format_output_filename(self, instance, filename, template, dir=False):
         """Format the expected output file of the Export job
 
@@ -252,19 +330,14 @@ class VraySubmitDeadline(pyblish.api.InstancePlugin):
 
         """
 
-        def smart_replace(string, key_values):
-            new_string = string
-            for key, value in key_values.items():
-                new_string = new_string.replace(key, value)
-            return new_string
-
         # Ensure filename has no extension
         file_name, _ = os.path.splitext(filename)
 
         # Reformat without tokens
-        output_path = smart_replace(template,
-                                    {"<Scene>": file_name,
-                                     "<Layer>": instance.name})
+        tokens = {"<Scene>": file_name,
+                  "<Layer>": instance.name}
+        output_path = TOKEN_RE.sub(lambda match: tokens[match.group(0)],
+                                   template)
 
         if dir:
             return output_path.replace("\\", "/")
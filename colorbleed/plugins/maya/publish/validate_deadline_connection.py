@@ -1,7 +1,7 @@
 import pyblish.api
 
 import avalon.api as api
-from avalon.vendor import requests
+import colorbleed.deadline as deadline
 from colorbleed.plugin import contextplugin_should_run
 
 
@@ -24,8 +24,10 @@ class ValidateDeadlineConnection(pyblish.api.ContextPlugin):
 
         assert AVALON_DEADLINE is not None, "Requires AVALON_DEADLINE"
 
-        # Check response
-        response = requests.get(AVALON_DEADLINE)
+        # Check response, this uses the session shared with the submitters
+        # so the connection is kept alive for the submissions
+        response = deadline.get_session().get(AVALON_DEADLINE,
+                                              timeout=deadline.TIMEOUT)
         assert response.ok, "Response must be ok"
         assert response.text.startswith("Deadline Web Service "), (
             "Web service did not respond with 'Deadline Web Service'"
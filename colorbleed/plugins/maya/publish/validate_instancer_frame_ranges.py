@@ -4,6 +4,8 @@ import pyblish.api
 
 VERBOSE = False
 
+TICK_RE = re.compile(r".+Tick([0-9]+)\.mcx$")
+
 
 def is_cache_resource(resource):
     """Return whether resource is a cacheFile resource"""
@@ -24,7 +26,7 @@ def filter_ticks(files):
     tick_files = set()
     ticks = set()
     for path in files:
-        match = re.match(".+Tick([0-9]+).mcx$", os.path.basename(path))
+        match = TICK_RE.match(os.path.basename(path))
         if match:
             tick_files.add(path)
             num = match.group(1)
@@ -29,6 +29,12 @@ class ValidateJointsHidden(pyblish.api.InstancePlugin):
     @staticmethod
     def get_invalid(instance):
         joints = cmds.ls(instance, type='joint', long=True)
+        if not joints:
+            return []
+
+        # Let Maya filter out the hidden joints in a single query so only
+        # the remaining joints need the more thorough visibility check
+        joints = cmds.ls(joints, visible=True, long=True)
         return [j for j in joints if lib.is_visible(j, displayLayer=True)]
 
     def process(self, instance):
@@ -21,11 +21,10 @@ class ValidateLookDefaultShadersConnections(pyblish.api.InstancePlugin):
     hosts = ['maya']
     label = 'Look Default Shader Connections'
 
-    # The default connections to check
-    DEFAULTS = [("initialShadingGroup.surfaceShader", "lambert1"),
-                ("initialParticleSE.surfaceShader", "lambert1"),
-                ("initialParticleSE.volumeShader", "particleCloud1")
-                ]
+    # The default connections to check, as plug: input node
+    DEFAULTS = {"initialShadingGroup.surfaceShader": "lambert1",
+                "initialParticleSE.surfaceShader": "lambert1",
+                "initialParticleSE.volumeShader": "particleCloud1"}
 
     def process(self, instance):
 
@@ -40,14 +39,23 @@ class ValidateLookDefaultShadersConnections(pyblish.api.InstancePlugin):
         else:
             context.data[key] = True
 
+        # Get the inputs of all plugs in a single query, returned as pairs
+        # of the plug and its input node
+        plugs = sorted(self.DEFAULTS)
+        connections = cmds.listConnections(plugs,
+                                           source=True,
+                                           destination=False,
+                                           connections=True) or []
+        inputs = dict()
+        iterator = iter(connections)
+        for plug, node in zip(iterator, iterator):
+            inputs.setdefault(plug, node)
+
         # Process as usual
         invalid = list()
-        for plug, input_node in self.DEFAULTS:
-            inputs = cmds.listConnections(plug,
-                                          source=True,
-                                          destination=False) or None
-
-            if not inputs or inputs[0] != input_node:
+        for plug in plugs:
+            input_node = self.DEFAULTS[plug]
+            if inputs.get(plug) != input_node:
                 self.log.error("{0} is not connected to {1}. "
                                "This can result in unexpected behavior. "
                                "Please reconnect to continue.".format(
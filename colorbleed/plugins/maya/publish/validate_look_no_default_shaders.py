@@ -29,8 +29,8 @@ class ValidateLookNoDefaultShaders(pyblish.api.InstancePlugin):
     label = 'Look No Default Shaders'
     actions = [colorbleed.maya.action.SelectInvalidAction]
 
-    DEFAULT_SHADERS = {"lambert1", "initialShadingGroup",
-                      "initialParticleSE", "particleCloud1"}
+    DEFAULT_SHADERS = frozenset(["lambert1", "initialShadingGroup",
+                                 "initialParticleSE", "particleCloud1"])
 
     def process(self, instance):
         """Process all the nodes in the instance"""
@@ -43,20 +43,40 @@ class ValidateLookNoDefaultShaders(pyblish.api.InstancePlugin):
     @classmethod
     def get_invalid(cls, instance):
 
+        nodes = instance[:]
+        if not nodes:
+            return []
+
+        # Get shading engine connections of all nodes in a single query,
+        # returned as pairs of the node's plug and the shading engine
+        connections = cmds.listConnections(nodes,
+                                           type="shadingEngine",
+                                           connections=True) or []
+
+        # Check for any disallowed connections on *all* nodes
+        disallowed = set()
+        iterator = iter(connections)
+        for plug, shader in zip(iterator, iterator):
+            if shader in cls.DEFAULT_SHADERS:
+                disallowed.add((shader, plug.split(".", 1)[0]))
+
+        # The plugs only have the shortest unique node names, so resolve
+        # the long names to match the instance members. An instanced shape
+        # has multiple paths, so report each of its paths that is in the
+        # instance, or all of them when none of them are members
+        members = set(cmds.ls(nodes, long=True))
+        long_names = {}
+        for node in set(node for _, node in disallowed):
+            paths = cmds.ls(node, long=True)
+            long_names[node] = [path for path in paths
+                                if path in members] or paths
+
+        # Explicitly log each individual "wrong" connection.
         invalid = set()
-        for node in instance:
-            # Get shading engine connections
-            shaders = cmds.listConnections(node, type="shadingEngine") or []
+        for shader, node in sorted(disallowed):
+            for path in long_names[node]:
+                cls.log.error("Node has unallowed connection to "
+                              "'{}': {}".format(shader, path))
+                invalid.add(path)
 
-            # Check for any disallowed connections on *all* nodes
-            if any(s in cls.DEFAULT_SHADERS for s in shaders):
-
-                # Explicitly log each individual "wrong" connection.
-                for s in shaders:
-                    if s in cls.DEFAULT_SHADERS:
-                        cls.log.error("Node has unallowed connection to "
-                                      "'{}': {}".format(s, node))
-
-                invalid.add(node)
-
-        return list(invalid)
+        return sorted(invalid)
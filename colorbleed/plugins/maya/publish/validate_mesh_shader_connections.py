@@ -3,6 +3,7 @@ from maya import cmds
 import pyblish.api
 import colorbleed.api
 import colorbleed.maya.action
+import colorbleed.maya.lib as lib
 
 
 def pairs(iterable):
@@ -12,7 +13,7 @@ def pairs(iterable):
         yield i, y
 
 
-def get_invalid_sets(shape):
+def get_invalid_sets(shape, cache=None):
     """Get sets that are considered related but do not contain the shape.
 
     In some scenarios Maya keeps connections to multiple shaders
@@ -21,34 +22,42 @@ def get_invalid_sets(shape):
     These are related sets returned by `maya.cmds.listSets` that don't
     actually have the shape as member.
 
+    Args:
+        shape (str): The long name of the shape.
+        cache (dict, optional): The long names of the members per set,
+            shared between calls so each set is queried only once.
+
     """
 
+    if cache is None:
+        cache = {}
+
     invalid = []
     sets = cmds.listSets(object=shape, t=1, extendToShape=False) or []
     for s in sets:
-        members = cmds.sets(s, query=True, nodesOnly=True)
-        if not members:
-            invalid.append(s)
-            continue
+        if s not in cache:
+            members = cmds.sets(s, query=True, nodesOnly=True)
+            cache[s] = set(cmds.ls(members, long=True)) if members else set()
 
-        members = set(cmds.ls(members, long=True))
-        if shape not in members:
+        if shape not in cache[s]:
             invalid.append(s)
 
     return invalid
 
 
-def disconnect(node_a, node_b):
-    """Remove all connections between node a and b."""
+def disconnect(node_a, nodes_b):
+    """Remove all connections between node a and any of the nodes b."""
+
+    nodes_b = set(nodes_b)
 
     # Disconnect outputs
     outputs = cmds.listConnections(node_a,
                                    plugs=True,
                                    connections=True,
                                    source=False,
-                                   destination=True)
+                                   destination=True) or []
     for output, destination in pairs(outputs):
-        if destination.split(".", 1)[0] == node_b:
+        if destination.split(".", 1)[0] in nodes_b:
             cmds.disconnectAttr(output, destination)
 
     # Disconnect inputs
@@ -56,9 +65,9 @@ def disconnect(node_a, node_b):
                                   plugs=True,
                                   connections=True,
                                   source=True,
-                                  destination=False)
+                                  destination=False) or []
     for input, source in pairs(inputs):
-        if source.split(".", 1)[0] == node_b:
+        if source.split(".", 1)[0] in nodes_b:
             cmds.disconnectAttr(source, input)
 
 
@@ -97,9 +106,11 @@ class ValidateMeshShaderConnections(pyblish.api.InstancePlugin):
         # todo: allow to check anything that can have a shader
         shapes = cmds.ls(shapes, noIntermediate=True, long=True, type="mesh")
 
+        # Shapes often share the same sets, so their members are cached
+        cache = {}
         invalid = []
         for shape in shapes:
-            if get_invalid_sets(shape):
+            if get_invalid_sets(shape, cache):
                 invalid.append(shape)
 
         return invalid
@@ -108,7 +119,14 @@ class ValidateMeshShaderConnections(pyblish.api.InstancePlugin):
     def repair(cls, instance):
 
         shapes = cls.get_invalid(instance)
-        for shape in shapes:
-            invalid_sets = get_invalid_sets(shape)
-            for set_node in invalid_sets:
-                disconnect(shape, set_node)
+        cache = {}
+
+        # Disconnect in a single undo step with parallel evaluation disabled
+        # so the graph is not re-evaluated for each of the disconnections
+        with lib.undo_chunk():
+            with lib.evaluation("off"):
+                for shape in shapes:
+                    # Disconnect from all invalid sets at once so the
+                    # connections of the shape are listed only once
+                    invalid_sets = get_invalid_sets(shape, cache)
+                    disconnect(shape, invalid_sets)
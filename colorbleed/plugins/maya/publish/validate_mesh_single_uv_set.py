@@ -1,4 +1,5 @@
 from maya import cmds
+import maya.api.OpenMaya as om
 
 import pyblish.api
 import colorbleed.api
@@ -29,15 +30,22 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
     def get_invalid(instance):
 
         meshes = cmds.ls(instance, type='mesh', long=True)
-
+        if not meshes:
+            return []
+
+        # Query the UV sets through the API to avoid a command per mesh.
+        # Each mesh is resolved on its own since a selection list merges
+        # duplicate and overlapping entries, which would misalign indices
+        selection = om.MSelectionList()
+        fn = om.MFnMesh()
         invalid = []
         for mesh in meshes:
-            uvSets = cmds.polyUVSet(mesh,
-                                    query=True,
-                                    allUVSets=True) or []
+            selection.clear()
+            selection.add(mesh)
+            fn.setObject(selection.getDagPath(0))
 
             # ensure unique (sometimes maya will list 'map1' twice)
-            uvSets = set(uvSets)
+            uvSets = set(fn.getUVSetNames())
 
             if len(uvSets) != 1:
                 invalid.append(mesh)
@@ -56,7 +64,7 @@ class ValidateMeshSingleUVSet(pyblish.api.InstancePlugin):
             # Maya 2017 and up allows multiple UV sets in Alembic exports
             # so we allow it, yet just warn the user to ensure they know about
             # the other UV sets.
-            allowed = int(cmds.about(version=True)) >= 2017
+            allowed = int(lib.get_maya_version()) >= 2017
 
             if allowed:
                 self.log.warning(message)
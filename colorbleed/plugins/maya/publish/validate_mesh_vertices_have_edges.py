@@ -5,6 +5,7 @@ from maya import cmds
 import pyblish.api
 import colorbleed.api
 import colorbleed.maya.action
+from colorbleed.maya.lib import get_maya_version
 
 
 def len_flattened(components):
@@ -69,7 +70,7 @@ class ValidateMeshVerticesHaveEdges(pyblish.api.InstancePlugin):
     def repair(cls, instance):
 
         # This fix only works in Maya 2016 EXT2 and newer
-        if float(cmds.about(version=True)) <= 2016.0:
+        if float(get_maya_version()) <= 2016.0:
             raise RuntimeError("Repair not supported in Maya version below "
                                "2016 EXT 2")
 
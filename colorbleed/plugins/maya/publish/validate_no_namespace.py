@@ -8,7 +8,7 @@ import colorbleed.maya.action
 
 def get_namespace(node_name):
     # ensure only node's name (not parent path)
-    node_name = node_name.rsplit("|")[-1]
+    node_name = node_name.rsplit("|", 1)[-1]
     # ensure only namespace
     return node_name.rpartition(":")[0]
 
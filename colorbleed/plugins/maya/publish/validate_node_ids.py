@@ -43,8 +43,8 @@ class ValidateNodeIDs(pyblish.api.InstancePlugin):
 
         # We do want to check the referenced nodes as it might be
         # part of the end product.
-        id_nodes = lib.get_id_required_nodes(referenced_nodes=True,
-                                             nodes=instance[:])
-        invalid = [n for n in id_nodes if not lib.get_id(n)]
+        id_nodes = list(lib.get_instance_id_required_nodes(instance))
+        ids = lib.get_ids(id_nodes)
+        invalid = [n for n, _id in zip(id_nodes, ids) if not _id]
 
         return invalid
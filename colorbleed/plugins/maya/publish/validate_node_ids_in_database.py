@@ -39,16 +39,20 @@ class ValidateNodeIdsInDatabase(pyblish.api.InstancePlugin):
         invalid = []
 
         # Get all id required nodes
-        id_required_nodes = lib.get_id_required_nodes(referenced_nodes=True,
-                                                      nodes=instance[:])
+        id_required_nodes = lib.get_instance_id_required_nodes(instance)
 
-        # check ids against database ids
-        db_asset_ids = io.find({"type": "asset"}).distinct("_id")
-        db_asset_ids = set(str(i) for i in db_asset_ids)
+        # check ids against database ids, these are queried only once for
+        # all instances in the publish
+        db_asset_ids = instance.context.data.get("assetIds")
+        if db_asset_ids is None:
+            db_asset_ids = io.find({"type": "asset"}).distinct("_id")
+            db_asset_ids = set(str(i) for i in db_asset_ids)
+            instance.context.data["assetIds"] = db_asset_ids
 
         # Get all asset IDs
-        for node in id_required_nodes:
-            cb_id = lib.get_id(node)
+        id_required_nodes = list(id_required_nodes)
+        cb_ids = lib.get_ids(id_required_nodes)
+        for node, cb_id in zip(id_required_nodes, cb_ids):
 
             # Ignore nodes without id, those are validated elsewhere
             if not cb_id:
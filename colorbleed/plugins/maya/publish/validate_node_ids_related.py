@@ -45,9 +45,8 @@ class ValidateNodeIDsRelated(pyblish.api.InstancePlugin):
 
         # We do want to check the referenced nodes as we it might be
         # part of the end product
-        for node in instance:
-
-            _id = lib.get_id(node)
+        nodes = list(instance)
+        for node, _id in zip(nodes, lib.get_ids(nodes)):
             if not _id:
                 continue
 
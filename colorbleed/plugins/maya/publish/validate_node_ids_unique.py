@@ -44,15 +44,15 @@ class ValidateNodeIdsUnique(pyblish.api.InstancePlugin):
 
         # Collect each id with their members
         ids = defaultdict(list)
-        for member in instance_members:
-            object_id = lib.get_id(member)
+        object_ids = lib.get_ids(instance_members)
+        for member, object_id in zip(instance_members, object_ids):
             if not object_id:
                 continue
             ids[object_id].append(member)
 
         # Take only the ids with more than one member
         invalid = list()
-        for _ids, members in ids.iteritems():
+        for _ids, members in ids.items():
             if len(members) > 1:
                 cls.log.error("ID found on multiple nodes: '%s'" % members)
                 invalid.extend(members)
@@ -1,4 +1,5 @@
 from maya import cmds
+import maya.api.OpenMaya as om
 
 import pyblish.api
 import colorbleed.api
@@ -30,14 +31,28 @@ class ValidateNodeNoGhosting(pyblish.api.InstancePlugin):
 
         # Transforms and shapes seem to have ghosting
         nodes = cmds.ls(instance, long=True, type=['transform', 'shape'])
+        if not nodes:
+            return []
+
+        # Query the values through the API to avoid running two commands
+        # per attribute for each of the nodes. Each node is resolved on its
+        # own since a selection list merges duplicate and overlapping
+        # entries, which would misalign indices
+        selection = om.MSelectionList()
+        fn = om.MFnDependencyNode()
         invalid = []
         for node in nodes:
-            for attr, required_value in cls._attributes.iteritems():
-                if cmds.attributeQuery(attr, node=node, exists=True):
+            selection.clear()
+            selection.add(node)
+            fn.setObject(selection.getDependNode(0))
+            for attr, required_value in cls._attributes.items():
+                if not fn.hasAttribute(attr):
+                    continue
 
-                    value = cmds.getAttr('{0}.{1}'.format(node, attr))
-                    if value != required_value:
-                        invalid.append(node)
+                value = fn.findPlug(attr, False).asInt()
+                if value != required_value:
+                    invalid.append(node)
+                    break
 
         return invalid
 
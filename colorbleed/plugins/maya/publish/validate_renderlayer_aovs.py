@@ -34,24 +34,19 @@ class ValidateRenderLayerAOVs(pyblish.api.InstancePlugin):
 
     def get_invalid(self, instance):
 
-        invalid = []
+        render_passes = instance.data.get("renderPasses", [])
+        if not render_passes:
+            return []
 
+        # Query all registered subsets of the render passes at once
         asset_name = instance.data["asset"]
-        render_passses = instance.data.get("renderPasses", [])
-        for render_pass in render_passses:
-            is_valid = self.validate_subset_registered(asset_name, render_pass)
-            if not is_valid:
-                invalid.append(render_pass)
-
-        return invalid
-
-    def validate_subset_registered(self, asset_name, subset_name):
-        """Check if subset is registered in the database under the asset"""
-
-        asset = io.find_one({"type": "asset", "name": asset_name})
-        is_valid = io.find_one({"type": "subset",
-                                "name": subset_name,
-                                "parent": asset["_id"]})
-
-        return is_valid
-
+        asset = io.find_one({"type": "asset", "name": asset_name},
+                            projection={"_id": True})
+        subsets = io.find({"type": "subset",
+                           "name": {"$in": render_passes},
+                           "parent": asset["_id"]},
+                          projection={"name": True})
+        registered = set(subset["name"] for subset in subsets)
+
+        return [render_pass for render_pass in render_passes
+                if render_pass not in registered]
@@ -57,13 +57,13 @@ class ValidateRenderSettings(pyblish.api.InstancePlugin):
 
         # Get the node attributes for current renderer
         attrs = lib.RENDER_ATTRS.get(renderer, lib.RENDER_ATTRS['default'])
-        prefix = lib.get_attr_in_layer("{node}.{prefix}".format(**attrs),
-                                       layer=layer)
-        padding = lib.get_attr_in_layer("{node}.{padding}".format(**attrs),
-                                        layer=layer)
+        prefix, padding, anim_override = lib.get_attrs_in_layer(
+            ["{node}.{prefix}".format(**attrs),
+             "{node}.{padding}".format(**attrs),
+             "defaultRenderGlobals.animation"],
+            layer=layer
+        )
 
-        anim_override = lib.get_attr_in_layer("defaultRenderGlobals.animation",
-                                              layer=layer)
         if not anim_override:
             invalid = True
             cls.log.error("Animation needs to be enabled. Use the same "
@@ -35,13 +35,16 @@ class ValidateVRayDistributedRendering(pyblish.api.InstancePlugin):
 
         renderlayer = instance.data['setMembers']
 
-        if not lib.get_attr_in_layer(self.enabled_attr, layer=renderlayer):
+        enabled, ignored = lib.get_attrs_in_layer([self.enabled_attr,
+                                                   self.ignored_attr],
+                                                  layer=renderlayer)
+        if not enabled:
             # If not distributed rendering enabled, ignore..
             return
 
         # If distributed rendering is enabled but it is *not* set to ignore
         # during batch mode we invalidate the instance
-        if not lib.get_attr_in_layer(self.ignored_attr, layer=renderlayer):
+        if not ignored:
             raise RuntimeError("Renderlayer has distributed rendering enabled "
                                "but is not set to ignore in batch mode.")
 